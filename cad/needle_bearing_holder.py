@@ -1,15 +1,33 @@
-from dataclasses import dataclass
+import math
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 import build123d as bd
 import build123d_ease as bde
 from build123d_ease import show
 from loguru import logger
+from OCP.BRepMesh import BRepMesh_IncrementalMesh  # pyright: ignore[reportAttributeAccessIssue]
+from OCP.StlAPI import StlAPI_Writer  # pyright: ignore[reportAttributeAccessIssue]
 
 # TODO(KilowattSynthesis): Add 2 bearings on the top, probably.
 
+_ROT_POS_X = bde.rotation.POS_X
+_ROT_POS_Y = bde.rotation.POS_Y
+_ANCHOR_BOTTOM = bde.align.ANCHOR_BOTTOM
+_ANCHOR_FRONT = bde.align.ANCHOR_FRONT
 
-@dataclass
+_BOLT_RADIUS = 3.2 / 2  # M3 clearance.
+_M3_TAP_RADIUS = 2.8 / 2
+
+# STL meshing, in absolute units (well under a 0.1mm layer height).
+_STL_TOLERANCE = 0.05  # mm
+_STL_ANGULAR_TOLERANCE = 0.2  # rad
+
+
+@dataclass(frozen=True, slots=True)
 class Spec:
     """Specification for bearing_holder."""
 
@@ -17,7 +35,7 @@ class Spec:
     bearing_id: float = 8.0
     bearing_thickness: float = 5.0
 
-    gap_between_bearings = 2.0
+    gap_between_bearings: float = 2.0
 
     general_wall_thickness: float = 3.0
 
@@ -36,356 +54,441 @@ class Spec:
     spool_width: float = 14.0
     spool_diameter: float = 72.0
 
-    def __post_init__(self) -> None:
-        """Post initialization checks."""
+    # Derived values, computed once in `__post_init__`.
+    bearing_holder_z_height: float = field(init=False)
+    """Height of the bearing holder."""
 
-    @property
-    def bearing_holder_z_height(self) -> float:
-        """Height of the bearing holder."""
-        return self.bearing_thickness * 2 + self.gap_between_bearings
-
-    @property
-    def diameter_at_spool_holder(self) -> float:
-        """Mating diameter at the the rotating rod riser and the spool holder.
-
-        Also the diameter of the long part of the bearing adapter.
-        """
-        # Could subtract a bit. -0.7mm was too much though.
-        return self.bearing_id
+    diameter_at_spool_holder: float = field(init=False)
+    """Mating diameter at the the rotating rod riser and the spool holder.
 
+    Also the diameter of the long part of the bearing adapter.
+    """
 
-def stepper_grip(spec: Spec) -> bd.Part | bd.Compound:
-    """Create a CAD model of bearing_holder."""
-    p = bd.Part(None)
-
-    # Add the stepper motor mount.
-    p += bd.Pos(
-        Y=spec.dist_stepper_to_needle_axis,
-        Z=(spec.mount_stepper_top_to_bottom_bearing_bottom),
-    ) * bd.Box(
-        spec.mount_stepper_width + 2 * spec.general_wall_thickness,
-        spec.mount_stepper_interface_depth + spec.general_wall_thickness,
-        spec.mount_stepper_width + spec.general_wall_thickness,
-        align=(bd.Align.CENTER, bd.Align.MIN, bd.Align.MAX),
-    )
-
-    # Add extension out to the bearing holder.
-    p += bd.Pos(
-        Y=spec.bearing_od / 2,
-        Z=(spec.mount_stepper_top_to_bottom_bearing_bottom),
-    ) * bd.Box(
-        spec.mount_stepper_width / 2,
-        spec.dist_stepper_to_needle_axis,
-        spec.mount_stepper_width + spec.general_wall_thickness,
-        align=(bd.Align.CENTER, bd.Align.MIN, bd.Align.MAX),
-    )
+    def __post_init__(self) -> None:
+        """Post initialization checks and derived values."""
+        # Frozen dataclass, so set the derived values via `object`.
+        object.__setattr__(
+            self,
+            "bearing_holder_z_height",
+            self.bearing_thickness * 2 + self.gap_between_bearings,
+        )
 
-    # Remove the literal stepper motor.
-    p -= bd.Pos(
-        Y=spec.dist_stepper_to_needle_axis + spec.general_wall_thickness,
-        Z=(
-            spec.mount_stepper_top_to_bottom_bearing_bottom
-            - spec.general_wall_thickness
-        ),
-    ) * bd.Box(
-        spec.mount_stepper_width,
-        spec.mount_stepper_interface_depth,
-        spec.mount_stepper_width,
-        align=(bd.Align.CENTER, bd.Align.MIN, bd.Align.MAX),
+        # Could subtract a bit. -0.7mm was too much though.
+        object.__setattr__(self, "diameter_at_spool_holder", self.bearing_id)
+
+
+@cache
+def _cylinder(
+    radius: float,
+    height: float,
+    rotation: tuple[float, float, float] = (0, 0, 0),
+    align: tuple[bd.Align, bd.Align, bd.Align] = (
+        bd.Align.CENTER,
+        bd.Align.CENTER,
+        bd.Align.CENTER,
+    ),
+) -> bd.Part:
+    """Create a cylinder, reusing one prototype per set of arguments.
+
+    Place it with `bd.Pos(...) * _cylinder(...)`, which makes a moved copy.
+    """
+    return bd.Cylinder(
+        radius=radius, height=height, rotation=rotation, align=align
     )
 
-    # Remove the raiser rod.
-    p -= bd.Pos(
-        Y=spec.bearing_od / 2,
-    ) * bd.Box(
-        spec.raiser_width_x + 0.1,
-        spec.raiser_width_y + 0.1,
-        spec.mount_stepper_top_to_bottom_bearing_bottom * 2,
-        align=(bd.Align.CENTER, bd.Align.MIN, bd.Align.MIN),
-    )
 
-    # Remove bolts.
-    for z in (-8, -21, -34):
-        p -= bd.Pos(
-            Y=spec.bearing_od / 2 + spec.raiser_width_y / 2,
-            Z=(spec.mount_stepper_top_to_bottom_bearing_bottom + z),
-        ) * bd.Cylinder(
-            radius=3.2 / 2,
-            height=spec.mount_stepper_width * 2,
-            rotation=bde.rotation.POS_X,
-        )
+def _fused(shapes: Iterable[bd.Compound]) -> bd.Compound:
+    """Fuse shapes in one n-ary boolean, e.g. to cut them all in one go.
 
-    return p
+    Cut with the fused result rather than passing overlapping shapes as
+    separate tools of one cut, as OCCT can silently drop some of them.
+    """
+    fused = bd.Part(None) + shapes
+    assert isinstance(fused, bd.Compound)
+    return fused
 
 
-def bearing_holder(spec: Spec) -> bd.Part | bd.Compound:
-    """Create a CAD model of bearing_holder and vertical bar."""
-    p = bd.Part(None)
+@cache
+def _bolt_pattern(spec: Spec) -> bd.Compound:
+    """Create the three bolts joining the stepper grip and bearing holder."""
+    bolt_y = spec.bearing_od / 2 + spec.raiser_width_y / 2
+    msz = spec.mount_stepper_top_to_bottom_bearing_bottom
 
-    # Draw the bearing holder (bottom).
-    p += bd.Cylinder(
-        radius=(spec.bearing_od / 2 + spec.general_wall_thickness),
-        height=(spec.bearing_thickness * 2 + spec.gap_between_bearings),
-        align=bde.align.ANCHOR_BOTTOM,
+    # Build the bolt once, and place copies of it.
+    bolt = _cylinder(
+        _BOLT_RADIUS, spec.mount_stepper_width * 2, rotation=_ROT_POS_X
     )
-
-    # Remove each of the bearings (bottom).
-    for bottom_z in (0, spec.bearing_thickness + spec.gap_between_bearings):
-        p -= bd.Pos(Z=bottom_z) * bd.Cylinder(
-            radius=spec.bearing_od / 2,
-            height=spec.bearing_thickness,
-            align=bde.align.ANCHOR_BOTTOM,
-        )
-
-    # Draw the bearing holder (top).
-    p += bd.Pos(Z=spec.mount_stepper_top_to_bottom_bearing_bottom) * (
-        bd.Cylinder(
-            radius=(spec.bearing_od / 2 + spec.general_wall_thickness),
-            height=(spec.bearing_thickness),
-            align=bde.align.ANCHOR_TOP,
-        )
-        - bd.Cylinder(
-            radius=(spec.bearing_od / 2),
-            height=(spec.bearing_thickness),
-            align=bde.align.ANCHOR_TOP,
-        )
+    return bd.Compound(
+        [bd.Pos(Y=bolt_y, Z=(msz + z)) * bolt for z in (-8, -21, -34)]
     )
 
-    # Draw the raiser rod.
-    p += bd.Pos(Y=spec.bearing_od / 2 + spec.raiser_width_y) * bd.Box(
-        spec.raiser_width_x,
-        spec.raiser_width_y,
-        spec.mount_stepper_top_to_bottom_bearing_bottom,
-        align=(bd.Align.CENTER, bd.Align.MAX, bd.Align.MIN),
-    )
 
-    # Remove hole though the middle.
-    p -= bd.Cylinder(
-        radius=(spec.bearing_od - 4) / 2,
-        height=(spec.bearing_thickness * 2 + spec.gap_between_bearings),
-        align=bde.align.ANCHOR_BOTTOM,
+@cache
+def _stepper_grip_raw(spec: Spec) -> bd.Part | bd.Compound:
+    """Create stepper_grip, without the bolt holes."""
+    bo2 = spec.bearing_od / 2
+    wall = spec.general_wall_thickness
+    msz = spec.mount_stepper_top_to_bottom_bearing_bottom
+    rwy = spec.raiser_width_y
+
+    p = _fused(
+        [
+            # Stepper motor mount.
+            bd.Pos(Y=spec.dist_stepper_to_needle_axis, Z=msz)
+            * bd.Box(
+                spec.mount_stepper_width + 2 * wall,
+                spec.mount_stepper_interface_depth + wall,
+                spec.mount_stepper_width + wall,
+                align=(bd.Align.CENTER, bd.Align.MIN, bd.Align.MAX),
+            ),
+            # Extension out to the bearing holder.
+            bd.Pos(Y=bo2, Z=msz)
+            * bd.Box(
+                spec.mount_stepper_width / 2,
+                spec.dist_stepper_to_needle_axis,
+                spec.mount_stepper_width + wall,
+                align=(bd.Align.CENTER, bd.Align.MIN, bd.Align.MAX),
+            ),
+        ]
     )
-
-    # Make it easier to pop the bearings out.
-    p -= bd.Pos(
-        Y=-spec.bearing_od / 2 - 1,
-        Z=spec.bearing_holder_z_height / 2,
-    ) * bd.Box(5, spec.bearing_od / 2, spec.gap_between_bearings + 3)
-
-    # Remove bolts.
-    for z in (-8, -21, -34):
-        p -= bd.Pos(
-            Y=spec.bearing_od / 2 + spec.raiser_width_y / 2,
-            Z=(spec.mount_stepper_top_to_bottom_bearing_bottom + z),
-        ) * bd.Cylinder(
-            radius=3.2 / 2,
-            height=spec.mount_stepper_width * 2,
-            rotation=bde.rotation.POS_X,
-        )
+    cutters = [
+        # The literal stepper motor.
+        bd.Pos(Y=spec.dist_stepper_to_needle_axis + wall, Z=(msz - wall))
+        * bd.Box(
+            spec.mount_stepper_width,
+            spec.mount_stepper_interface_depth,
+            spec.mount_stepper_width,
+            align=(bd.Align.CENTER, bd.Align.MIN, bd.Align.MAX),
+        ),
+        # The raiser rod (through the top, with 1mm to spare).
+        bd.Pos(Y=bo2)
+        * bd.extrude(
+            bd.Rectangle(
+                spec.raiser_width_x + 0.1,
+                rwy + 0.1,
+                align=(bd.Align.CENTER, bd.Align.MIN),
+            ),
+            amount=msz + 1,
+        ),
+    ]
+    p -= _fused(cutters)
 
     return p
 
 
-def assembly(spec: Spec) -> bd.Part | bd.Compound:
-    """Create a CAD model of the assembly."""
-    p = bd.Part(None)
+@cache
+def stepper_grip(spec: Spec) -> bd.Part | bd.Compound:
+    """Create a CAD model of bearing_holder."""
+    return _stepper_grip_raw(spec) - _bolt_pattern(spec)
+
+
+@cache
+def _bearing_holder_raw(spec: Spec) -> bd.Part | bd.Compound:
+    """Create bearing_holder, without the bolt holes."""
+    bo2 = spec.bearing_od / 2
+    wall = spec.general_wall_thickness
+    bh_z = spec.bearing_holder_z_height
+    msz = spec.mount_stepper_top_to_bottom_bearing_bottom
+    rwy = spec.raiser_width_y
+
+    # The top ring and the raiser rod don't reach into any of the cutters,
+    # so they can be added along with the rest before cutting.
+    p = _fused(
+        [
+            # Bearing holder (bottom).
+            bd.Cylinder(
+                radius=(bo2 + wall), height=bh_z, align=_ANCHOR_BOTTOM
+            ),
+            # Bearing holder (top), as an extruded ring.
+            bd.Pos(Z=msz - spec.bearing_thickness)
+            * bd.extrude(
+                bd.Sketch(bd.Circle(bo2 + wall) - bd.Circle(bo2)),
+                amount=spec.bearing_thickness,
+            ),
+            # Raiser rod.
+            bd.Pos(Y=bo2 + rwy)
+            * bd.Box(
+                spec.raiser_width_x,
+                rwy,
+                msz,
+                align=(bd.Align.CENTER, bd.Align.MAX, bd.Align.MIN),
+            ),
+        ]
+    )
+    cutters = [
+        # Each of the bearings (bottom).
+        *(
+            bd.Pos(Z=bottom_z)
+            * _cylinder(bo2, spec.bearing_thickness, align=_ANCHOR_BOTTOM)
+            for bottom_z in (
+                0,
+                spec.bearing_thickness + spec.gap_between_bearings,
+            )
+        ),
+        # Hole though the middle.
+        bd.Cylinder(
+            radius=(spec.bearing_od - 4) / 2,
+            height=bh_z,
+            align=_ANCHOR_BOTTOM,
+        ),
+        # Make it easier to pop the bearings out.
+        bd.Pos(Y=-bo2 - 1, Z=bh_z / 2)
+        * bd.Box(5, bo2, spec.gap_between_bearings + 3),
+    ]
+    p -= _fused(cutters)
 
-    # Add the bearing holder.
-    p += bearing_holder(spec)
+    return p
 
-    # Add the stepper motor mount.
-    p += stepper_grip(spec)
 
-    p += bd.Pos(X=25) * bearing_adapter(spec)
+@cache
+def bearing_holder(spec: Spec) -> bd.Part | bd.Compound:
+    """Create a CAD model of bearing_holder and vertical bar."""
+    return _bearing_holder_raw(spec) - _bolt_pattern(spec)
 
-    p += bd.Pos(
-        X=50,
-        Z=spec.mount_stepper_top_to_bottom_bearing_bottom,
-    ) * spool_holder(spec)
 
-    p += bd.Pos(
-        X=50,
-        Z=spec.mount_stepper_top_to_bottom_bearing_bottom / 2,
-    ) * locking_ring(spec)
+@cache
+def assembly(spec: Spec) -> bd.Part | bd.Compound:
+    """Create a CAD model of the assembly."""
+    msz = spec.mount_stepper_top_to_bottom_bearing_bottom
+
+    # Add the bearing holder and the stepper motor mount.
+    # They share the bolt holes, so cut those once from the union.
+    mount = _fused([_bearing_holder_raw(spec), _stepper_grip_raw(spec)])
+    mount -= _bolt_pattern(spec)
+
+    # Union the loose parts (disjoint from each other) as their own group.
+    loose_parts = _fused(
+        [
+            bd.Pos(X=25) * bearing_adapter(spec),
+            bd.Pos(X=50, Z=msz) * spool_holder(spec),
+            bd.Pos(X=50, Z=msz / 2) * locking_ring(spec),
+        ]
+    )
 
-    return p
+    return _fused([mount, loose_parts])
 
 
+@cache
 def bearing_adapter(spec: Spec) -> bd.Part | bd.Compound:
     """Adapter on the inside of the bearing, to the sewing needle."""
-    p = bd.Part(None)
+    bh_z = spec.bearing_holder_z_height
+    msz = spec.mount_stepper_top_to_bottom_bearing_bottom
 
     offset_down = 5
-
-    p += bd.Cylinder(
-        radius=spec.bearing_id / 2,
-        height=spec.bearing_holder_z_height + offset_down,
-        align=bde.align.ANCHOR_BOTTOM,
-    ).translate((0, 0, -offset_down))
-
-    # Add flange.
-    p += bd.Pos(Z=spec.bearing_holder_z_height) * bd.Cone(
-        top_radius=8 / 2,
-        bottom_radius=spec.bearing_id / 2 + 2,
-        height=spec.general_wall_thickness,
-        align=bde.align.ANCHOR_BOTTOM,
-    )
-
-    # Add part all the way to the top.
-    p += bd.Pos(Z=0) * bd.Cylinder(
-        radius=spec.diameter_at_spool_holder / 2,
-        height=spec.mount_stepper_top_to_bottom_bearing_bottom + 12,
-        align=bde.align.ANCHOR_BOTTOM,
-    )
-
-    # Remove the needle shaft (round, with flats).
-    p -= (
-        bd.Cone(  # Cone for friction fit.
-            top_radius=(spec.needle_shaft_od - 0.15) / 2,
-            bottom_radius=spec.needle_shaft_od / 2,
-            height=spec.bearing_holder_z_height,
-            align=bde.align.ANCHOR_BOTTOM,
-        )
-        & bd.Box(
-            spec.needle_shaft_flats_width,
-            10,
-            spec.bearing_holder_z_height,
-            align=bde.align.ANCHOR_BOTTOM,
-        )
-    ).translate((0, 0, -offset_down))
-
-    # Remove passage for the thread/wire (bottom).
-    p -= bd.Pos(Z=spec.bearing_holder_z_height + 2) * bd.Cylinder(
-        radius=3.2 / 2,
-        height=spec.bearing_holder_z_height * 5,
-    ).rotate(axis=bd.Axis.Y, angle=40)
-    p -= bd.Pos(
-        X=-spec.bearing_id / 2, Z=spec.bearing_holder_z_height
-    ) * bd.Box(
-        1.5,
-        3,
-        25,
-        align=(bd.Align.MIN, bd.Align.CENTER, bd.Align.MAX),
-    )
-
-    # Remove passage for the thread/wire (top, on +X side).
-    p -= bd.Pos(
-        X=spec.bearing_id / 2,
-        Z=spec.mount_stepper_top_to_bottom_bearing_bottom,
-    ) * bd.Box(
-        3,
-        3,
-        25,
-        align=(bd.Align.MAX, bd.Align.CENTER, bd.Align.CENTER),
-    )
-
-    # Remove M3 hole in the top.
-    p -= bd.Pos(
-        Z=spec.mount_stepper_top_to_bottom_bearing_bottom + 7,
-    ) * bd.Cylinder(
-        radius=2.8 / 2,
-        height=40,
-        rotation=bde.rotation.POS_Y,
+    flange_radius = spec.bearing_id / 2 + 2
+    thread_tilt = 40
+
+    p = _fused(
+        [
+            # Inside of the bearings.
+            bd.Pos(Z=-offset_down)
+            * bd.Cylinder(
+                radius=spec.bearing_id / 2,
+                height=bh_z + offset_down,
+                align=_ANCHOR_BOTTOM,
+            ),
+            # Flange.
+            bd.Pos(Z=bh_z)
+            * bd.Cone(
+                top_radius=8 / 2,
+                bottom_radius=flange_radius,
+                height=spec.general_wall_thickness,
+                align=_ANCHOR_BOTTOM,
+            ),
+            # Part all the way to the top.
+            bd.Cylinder(
+                radius=spec.diameter_at_spool_holder / 2,
+                height=msz + 12,
+                align=_ANCHOR_BOTTOM,
+            ),
+        ]
     )
+    cutters = [
+        # Needle shaft (round, with flats).
+        bd.Pos(Z=-offset_down)
+        * (
+            bd.Cone(  # Cone for friction fit.
+                top_radius=(spec.needle_shaft_od - 0.15) / 2,
+                bottom_radius=spec.needle_shaft_od / 2,
+                height=bh_z,
+                align=_ANCHOR_BOTTOM,
+            )
+            & bd.Box(
+                spec.needle_shaft_flats_width,
+                10,
+                bh_z,
+                align=_ANCHOR_BOTTOM,
+            )
+        ),
+        # Passage for the thread/wire (bottom).
+        # Tilted, and just long enough to exit past the flange on both ends.
+        bd.Pos(Z=bh_z + 2)
+        * _cylinder(
+            _BOLT_RADIUS,
+            (
+                2
+                * (flange_radius + _BOLT_RADIUS)
+                / math.sin(math.radians(thread_tilt))
+            ),
+            rotation=(0, thread_tilt, 0),
+        ),
+        bd.Pos(X=-spec.bearing_id / 2, Z=bh_z)
+        * bd.Box(
+            1.5,
+            3,
+            25,
+            align=(bd.Align.MIN, bd.Align.CENTER, bd.Align.MAX),
+        ),
+        # Passage for the thread/wire (top, on +X side).
+        bd.Pos(X=spec.bearing_id / 2, Z=msz)
+        * bd.Box(
+            3,
+            3,
+            25,
+            align=(bd.Align.MAX, bd.Align.CENTER, bd.Align.CENTER),
+        ),
+        # M3 hole in the top.
+        bd.Pos(Z=msz + 7)
+        * bd.Cylinder(
+            radius=_M3_TAP_RADIUS,
+            height=40,
+            rotation=_ROT_POS_Y,
+        ),
+    ]
+    p -= _fused(cutters)
 
     return p
 
 
+@cache
 def spool_holder(spec: Spec) -> bd.Part | bd.Compound:
     """Make the spool holder."""
-    p = bd.Part(None)
-
     base_t = 10
 
-    p += bd.Box(
-        spec.spool_width + 2 * spec.general_wall_thickness,
-        10,
-        base_t + spec.spool_diameter / 2 + 10,
-        align=bde.align.ANCHOR_BOTTOM,
-    )
-
-    p -= bd.Cylinder(
-        radius=(spec.diameter_at_spool_holder + 0.1) / 2,
-        height=10,
-        align=bde.align.ANCHOR_BOTTOM,
-    )
-
-    # Create a gap for bolt clamping.
-    p -= bd.Box(3, 10, 50, align=bde.align.ANCHOR_FRONT)
+    holder_x = spec.spool_width + 2 * spec.general_wall_thickness
+    holder_y = 10
+    holder_z = base_t + spec.spool_diameter / 2 + 10
 
-    # Remove screw hole.
-    p -= bd.Pos(Z=10 / 2) * bd.Cylinder(
-        radius=3.2 / 2,
-        height=100,
-        rotation=bde.rotation.POS_X,
-    )
-
-    # Remove the spool.
-    p -= bd.Pos(Z=base_t) * bd.Box(
-        spec.spool_width,
-        100,
-        1000,
-        align=bde.align.ANCHOR_BOTTOM,
-    )
+    p = bd.Part(None)
+    p += bd.Box(holder_x, holder_y, holder_z, align=_ANCHOR_BOTTOM)
 
-    # Remove the screw through the spool.
-    p -= bd.Pos(Z=base_t + spec.spool_diameter / 2) * bd.Cylinder(
-        radius=3.2 / 2,
-        height=1000,
-        rotation=bde.rotation.POS_X,
-    )
+    cutters = [
+        bd.Cylinder(
+            radius=(spec.diameter_at_spool_holder + 0.1) / 2,
+            height=10,
+            align=_ANCHOR_BOTTOM,
+        ),
+        # Gap for bolt clamping.
+        bd.Box(3, 10, 50, align=_ANCHOR_FRONT),
+        # Screw hole (1mm past the holder on each side).
+        bd.Pos(Z=10 / 2)
+        * _cylinder(_BOLT_RADIUS, holder_x + 2, rotation=_ROT_POS_X),
+        # The spool (1mm past the holder front/back and top).
+        bd.Pos(Z=base_t)
+        * bd.Box(
+            spec.spool_width,
+            holder_y + 2,
+            holder_z - base_t + 1,
+            align=_ANCHOR_BOTTOM,
+        ),
+        # Screw through the spool (1mm past the holder on each side).
+        bd.Pos(Z=base_t + spec.spool_diameter / 2)
+        * _cylinder(_BOLT_RADIUS, holder_x + 2, rotation=_ROT_POS_X),
+    ]
+    p -= _fused(cutters)
 
     return p
 
 
+@cache
 def locking_ring(spec: Spec) -> bd.Part | bd.Compound:
     """Locking ring for just below the top bearing/spool."""
     p = bd.Part(None)
-
     p += bd.Cylinder(
         radius=spec.diameter_at_spool_holder / 2 + spec.general_wall_thickness,
         height=6,
-        align=bde.align.ANCHOR_BOTTOM,
+        align=_ANCHOR_BOTTOM,
     )
 
-    p -= bd.Cylinder(
-        radius=spec.diameter_at_spool_holder / 2,
-        height=10,
-        align=bde.align.ANCHOR_BOTTOM,
+    cutters = [
+        bd.Cylinder(
+            radius=spec.diameter_at_spool_holder / 2,
+            height=10,
+            align=_ANCHOR_BOTTOM,
+        ),
+        # Gap for bolt clamping.
+        bd.Box(
+            2,
+            10,
+            30,
+            align=_ANCHOR_FRONT,
+        ),
+    ]
+    p -= _fused(cutters)
+
+    return p
+
+
+def export_stl(part: bd.Part | bd.Compound, path: Path) -> None:
+    """Export a binary STL, meshed with an absolute tolerance.
+
+    `bd.export_stl` only meshes with a tolerance relative to each edge, which
+    over-tessellates the small features (bolt holes, needle shaft).
+    """
+    BRepMesh_IncrementalMesh(
+        theShape=part.wrapped,
+        theLinDeflection=_STL_TOLERANCE,
+        isRelative=False,
+        theAngDeflection=_STL_ANGULAR_TOLERANCE,
+        isInParallel=True,
     )
 
-    # Create a gap for bolt clamping.
-    p -= bd.Box(
-        2,
-        10,
-        30,
-        align=bde.align.ANCHOR_FRONT,
+    writer = StlAPI_Writer()
+    writer.ASCIIMode = False
+    if not writer.Write(part.wrapped, str(path)):
+        msg = f"Failed to write STL: {path}"
+        raise OSError(msg)
+
+
+def export_part(
+    name: str, part: bd.Part | bd.Compound, export_folder: Path
+) -> None:
+    """Check a part and export it as STL and STEP."""
+    assert isinstance(part, bd.Part | bd.Solid | bd.Compound), (
+        f"{name} is not an expected type ({type(part)})"
     )
+    # Walks the whole topology, so only done when asked for.
+    if os.environ.get("CHECK_MANIFOLD") and not part.is_manifold:
+        logger.warning(f"Part '{name}' is not manifold")
 
-    return p
+    export_stl(part, export_folder / f"{name}.stl")
+    bd.export_step(part, str(export_folder / f"{name}.step"))
 
 
 if __name__ == "__main__":
+    spec = Spec()
+
+    # Sending the model to the viewer is slow, so only done when asked for.
+    if os.environ.get("SHOW"):
+        logger.info("Showing CAD model(s)")
+        show(assembly(spec))
+
+    # The builders are cached, so each part is built once, and the assembly
+    # reuses the parts built for it.
     parts = {
-        "assembly": show(assembly(Spec())),
-        "bearing_holder": (bearing_holder(Spec())),
-        "stepper_grip": (stepper_grip(Spec())),
-        "bearing_adapter": (bearing_adapter(Spec())),
-        "spool_holder": (spool_holder(Spec())),
-        "locking_ring": (locking_ring(Spec())),
+        "assembly": assembly(spec),
+        "bearing_holder": bearing_holder(spec),
+        "stepper_grip": stepper_grip(spec),
+        "bearing_adapter": bearing_adapter(spec),
+        "spool_holder": spool_holder(spec),
+        "locking_ring": locking_ring(spec),
     }
 
-    logger.info("Showing CAD model(s)")
-
     (export_folder := Path(__file__).parent.with_name("build")).mkdir(
         exist_ok=True
     )
+    # Exported one at a time: the STL meshing already runs on all cores, and
+    # the parts share sub-shapes with the assembly, so meshing them
+    # concurrently isn't safe.
     for name, part in parts.items():
-        assert isinstance(part, bd.Part | bd.Solid | bd.Compound), (
-            f"{name} is not an expected type ({type(part)})"
-        )
-        if not part.is_manifold:
-            logger.warning(f"Part '{name}' is not manifold")
-
-        bd.export_stl(part, str(export_folder / f"{name}.stl"))
-        bd.export_step(part, str(export_folder / f"{name}.step"))
+        export_part(name, part, export_folder)